@@ -1,6 +1,8 @@
 from typing import ClassVar
 
-fpl_waypoint_types = ["USER WAYPOINT", "AIRPORT", "NDB", "VOR", "INT", "INT-VRP"]
+# types are listed in this order in validation messages, the set is used for membership checks
+fpl_waypoint_types_ordered = ("USER WAYPOINT", "AIRPORT", "NDB", "VOR", "INT", "INT-VRP")
+fpl_waypoint_types = frozenset(fpl_waypoint_types_ordered)
 
 
 class Namespaces:
@@ -65,8 +67,6 @@ class Namespaces:
         :rtype: str
         :return: schema location attribute value
         """
-        schema_locations = ""
-        for prefix, location in Namespaces._schema_locations.items():
-            schema_locations = f"{schema_locations} {Namespaces.namespaces[prefix]} {location}"
-
-        return schema_locations.lstrip()
+        return " ".join(
+            f"{Namespaces.namespaces[prefix]} {location}" for prefix, location in Namespaces._schema_locations.items()
+        )
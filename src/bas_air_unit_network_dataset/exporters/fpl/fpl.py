@@ -1,18 +1,45 @@
 from __future__ import annotations
 
-import subprocess
+from functools import cache
 from importlib.resources import path as resource_path
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from typing import Optional
 
-from lxml.etree import Element, ElementTree
+from lxml.etree import DocumentInvalid, Element, ElementTree, SubElement, XMLSchema
+from lxml.etree import parse as element_parse
 from lxml.etree import tostring as element_string
 
 from bas_air_unit_network_dataset.exporters.fpl import Namespaces
 from bas_air_unit_network_dataset.exporters.fpl.route import Route
 from bas_air_unit_network_dataset.exporters.fpl.waypoint import Waypoint
 
+with resource_path("bas_air_unit_network_dataset.exporters.fpl", "__init__.py") as _path:
+    _schema_path = _path.parent.joinpath("schemas/garmin/FlightPlanv1.xsd")
+
+_flight_plan_tag = f"{{{Namespaces.fpl}}}flight-plan"
+_waypoint_table_tag = f"{{{Namespaces.fpl}}}waypoint-table"
+_schema_location_attribute = f"{{{Namespaces.xsi}}}schemaLocation"
+_nsmap = Namespaces.nsmap()
+_schema_locations = Namespaces.schema_locations()
+_xml_declaration = b"<?xml version='1.0' encoding='utf-8'?>\n"
+
+
+@cache
+def _load_schema(path: Path) -> XMLSchema:
+    """
+    Load and compile an XSD schema.
+
+    Compiled schemas are cached to avoid re-parsing the same schema for each flight plan that is validated.
+
+    :type path: Path
+    :param path: XSD schema file path
+    :rtype: XMLSchema
+    :return: compiled schema
+    """
+    # Exempting Bandit security issue (parsing untrusted XML)
+    # Schemas are trusted files distributed as part of this package.
+    return XMLSchema(element_parse(str(path)))  # noqa: S320
+
 
 class Fpl:
     """
@@ -46,6 +73,8 @@ class Fpl:
     authoring information and using different symbols. See #31 for more information.
     """
 
+    __slots__ = ("schema_path", "_waypoints", "_route")
+
     def __init__(self, waypoints: Optional[list[Waypoint]] = None, route: Optional[Route] = None) -> None:
         """
         Create FPL, optionally setting parameters.
@@ -55,10 +84,7 @@ class Fpl:
         :type route: list
         :param route: optional list of FPL routes
         """
-        self.ns = Namespaces()
-
-        with resource_path("bas_air_unit_network_dataset.exporters.fpl", "__init__.py") as path:
-            self.schema_path = path.parent.joinpath("schemas/garmin/FlightPlanv1.xsd")
+        self.schema_path = _schema_path
 
         self._waypoints: list[Waypoint] = []
         self._route: Optional[Route] = None
@@ -113,84 +139,82 @@ class Fpl:
         """
         self._route = route
 
-    def dumps_xml(self) -> bytes:
+    def encode(self) -> Element:
         """
-        Build an XML element tree for the flight plan and generate an XML document.
+        Build an XML element for the flight plan.
 
-        Elements for any waypoints and routes contained in the flight plan are added to a route element. An XML document
-        is generated from this root, encoded as a UTF-8 byte string, with pretty-printing and an XML declaration.
+        Elements for any waypoints and routes contained in the flight plan are created within a root element.
 
-        :rtype: bytes
-        :return: XML document as byte string
+        :rtype: Element
+        :return: (L)XML element
         """
         root = Element(
-            f"{{{self.ns.fpl}}}flight-plan",
+            _flight_plan_tag,
             attrib={
-                f"{{{self.ns.xsi}}}schemaLocation": self.ns.schema_locations(),
+                _schema_location_attribute: _schema_locations,
             },
-            nsmap=self.ns.nsmap(),
+            nsmap=_nsmap,
         )
 
         if len(self.waypoints) > 1:
-            waypoints_table = Element(f"{{{self.ns.fpl}}}waypoint-table")
+            waypoints_table = SubElement(root, _waypoint_table_tag)
             for waypoint in self.waypoints:
-                waypoints_table.append(waypoint.encode())
-            root.append(waypoints_table)
+                waypoint.encode(parent=waypoints_table)
 
         if self.route is not None:
-            root.append(self.route.encode())
+            self.route.encode(parent=root)
 
-        document = ElementTree(root)
-        return element_string(document, pretty_print=True, xml_declaration=True, encoding="utf-8")
+        return root
 
-    def dump_xml(self, path: Path) -> None:
+    def dumps_xml(self, pretty_print: bool = True) -> bytes:
+        """
+        Generate an XML document for the flight plan.
+
+        An XML document is generated from the root element returned by `encode()`, encoded as a UTF-8 byte string, with
+        an XML declaration and, optionally, pretty-printing.
+
+        Pretty-printing requires an additional pass over the tree. It can be disabled where the document is not intended
+        to be read by humans.
+
+        :type pretty_print: bool
+        :param pretty_print: whether to indent the generated document
+        :rtype: bytes
+        :return: XML document as byte string
+        """
+        document = ElementTree(self.encode())
+        return element_string(document, pretty_print=pretty_print, xml_declaration=True, encoding="utf-8")
+
+    def dump_xml(self, path: Path, pretty_print: bool = True) -> None:
         """
         Write the flight plan to a file as XML.
 
-        XML is the only supported file format for FPLs. This method is wrapper around the `dumps_xml()` method.
+        XML is the only supported file format for FPLs. The document is serialised directly to the output file, rather
+        than via the byte string returned by `dumps_xml()`. The XML declaration is written separately, as lxml would
+        otherwise upper-case the encoding name, making output differ from `dumps_xml()`.
 
         :type path: Path
         :param path: XML output path
+        :type pretty_print: bool
+        :param pretty_print: whether to indent the generated document
         """
-        with path.open(mode="w") as xml_file:
-            xml_file.write(self.dumps_xml().decode())
+        with path.open(mode="wb") as xml_file:
+            xml_file.write(_xml_declaration)
+            ElementTree(self.encode()).write(xml_file, pretty_print=pretty_print, encoding="utf-8")
 
     def validate(self) -> None:
         """
         Validate contents of a flight plan against a XSD schema.
 
-        The external `xmllint` binary is used for validation as the `lxml` methods do not easily support relative paths
-        for schemas that use imports/includes.
-
         Schemas are loaded from an XSD directory within this package using a backport of the `importlib.files` method.
-        The current flight plan object is written as an XML file to a temporary directory to pass to xmllint.
-
-        The xmllint binary returns a 0 exit code if the record validates successfully. Therefore, any other exit code
-        can be, and is, considered a validation failure, raising a RuntimeError exception.
-
-        :raises RuntimeError: where validation fails, message includes any stderr output from xmllint
-        """
-        with TemporaryDirectory() as document_path:
-            document_path = Path(document_path).joinpath("fpl.xml")
-            self.dump_xml(path=document_path)
-
-            try:
-                # Exempting Bandit/flake8 security issue (using subprocess)
-                # It is assumed that there are other protections in place to prevent untrusted input being a concern.
-                # Namely, that this package will be run in a secure/controlled environments against pre-trusted files.
-                #
-                # Use `capture_output=True` in future when we can use Python 3.7+
-                subprocess.run(
-                    args=[
-                        "xmllint",
-                        "--noout",
-                        "--schema",
-                        str(self.schema_path),
-                        str(document_path),
-                    ],
-                    capture_output=True,
-                    check=True,
-                )
-            except subprocess.CalledProcessError as e:
-                msg = f"Record validation failed: {e.stderr.decode()}"
-                raise RuntimeError(msg) from e
+        The FPL schema is self-contained (it does not use imports/includes) so can be compiled and applied in-process
+        using `lxml`. Compiled schemas are cached between flight plans.
+
+        The current flight plan object is validated as an in-memory element tree, without being serialised.
+
+        :raises RuntimeError: where validation fails, message includes any errors reported by the schema validator
+        """
+        try:
+            _load_schema(self.schema_path).assertValid(self.encode())
+        except DocumentInvalid as e:
+            msg = f"Record validation failed: {e.error_log}"
+            raise RuntimeError(msg) from e
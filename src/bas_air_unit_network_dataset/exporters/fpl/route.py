@@ -8,6 +8,11 @@ from bas_air_unit_network_dataset.exporters.fpl import Namespaces
 from bas_air_unit_network_dataset.exporters.fpl.route_waypoint import RouteWaypoint
 from bas_air_unit_network_dataset.exporters.fpl.utils import _upper_alphanumeric_space_only
 
+_route_tag = f"{{{Namespaces.fpl}}}route"
+_route_name_tag = f"{{{Namespaces.fpl}}}route-name"
+_flight_plan_index_tag = f"{{{Namespaces.fpl}}}flight-plan-index"
+_nsmap = Namespaces.nsmap()
+
 
 class Route:
     """
@@ -18,6 +23,8 @@ class Route:
     See the abstract route class for general information on these properties and methods.
     """
 
+    __slots__ = ("_name", "_index", "_points")
+
     max_route_waypoints = 3_000
 
     def __init__(
@@ -36,8 +43,6 @@ class Route:
         :type points: list
         :param points: optional list of route waypoints describing the path of the route (max: 3000)
         """
-        self.ns = Namespaces()
-
         self._name: Optional[str] = None
         self._index: Optional[int] = None
         self._points: Optional[list[RouteWaypoint]] = []
@@ -149,19 +154,25 @@ class Route:
 
         self._points = points
 
-    def encode(self) -> Element:
+    def encode(self, parent: Optional[Element] = None) -> Element:
         """
         Build an XML element for the FPL route.
 
+        If a parent element is given, the route element is created directly within it, rather than as a standalone
+        element that needs to be appended to a parent later. Route waypoint elements are always created within the
+        route element.
+
+        :type parent: Element
+        :param parent: optional element to create route element within
         :rtype: Element
         :return: (L)XML element
         """
-        route = Element(f"{{{self.ns.fpl}}}route", nsmap=self.ns.nsmap())
+        route = Element(_route_tag, nsmap=_nsmap) if parent is None else SubElement(parent, _route_tag)
 
-        route_name = SubElement(route, f"{{{self.ns.fpl}}}route-name")
+        route_name = SubElement(route, _route_name_tag)
         route_name.text = self.name
 
-        route_index = SubElement(route, f"{{{self.ns.fpl}}}flight-plan-index")
+        route_index = SubElement(route, _flight_plan_index_tag)
         route_index.text = str(self.index)
 
         if len(self.points) > self.max_route_waypoints:
@@ -169,6 +180,6 @@ class Route:
             raise ValueError(msg)
 
         for route_point in self.points:
-            route.append(route_point.encode())
+            route_point.encode(parent=route)
 
         return route
@@ -4,9 +4,15 @@ from typing import Optional
 
 from lxml.etree import Element, SubElement
 
-from bas_air_unit_network_dataset.exporters.fpl import Namespaces, fpl_waypoint_types
+from bas_air_unit_network_dataset.exporters.fpl import Namespaces, fpl_waypoint_types, fpl_waypoint_types_ordered
 from bas_air_unit_network_dataset.exporters.fpl.utils import _upper_alphanumeric_only
 
+_route_point_tag = f"{{{Namespaces.fpl}}}route-point"
+_waypoint_identifier_tag = f"{{{Namespaces.fpl}}}waypoint-identifier"
+_waypoint_type_tag = f"{{{Namespaces.fpl}}}waypoint-type"
+_waypoint_country_code_tag = f"{{{Namespaces.fpl}}}waypoint-country-code"
+_nsmap = Namespaces.nsmap()
+
 
 class RouteWaypoint:
     """
@@ -15,6 +21,8 @@ class RouteWaypoint:
     Concrete representation of an abstract route waypoint (waypoints within a route) using the FPL output format.
     """
 
+    __slots__ = ("_waypoint_reference", "_waypoint_type", "_waypoint_country_code")
+
     max_identifier_length = 17
     max_country_code_length = 2
     max_comment_length = 25
@@ -35,8 +43,6 @@ class RouteWaypoint:
         :type waypoint_country_code: str
         :param waypoint_country_code:
         """
-        self.ns = Namespaces()
-
         self._waypoint_reference: str
         self._waypoint_type: str
         self._waypoint_country_code: str
@@ -98,7 +104,7 @@ class RouteWaypoint:
         :param waypoint_type: FPL waypoint type
         """
         if waypoint_type not in fpl_waypoint_types:
-            msg = f"Waypoint type must be one of {' '.join(fpl_waypoint_types)!r}"
+            msg = f"Waypoint type must be one of {' '.join(fpl_waypoint_types_ordered)!r}"
             raise ValueError(msg)
 
         self._waypoint_type = waypoint_type
@@ -135,22 +141,29 @@ class RouteWaypoint:
         if waypoint_country_code == "__":
             self._waypoint_country_code = "__"
 
-    def encode(self) -> Element:
+    def encode(self, parent: Optional[Element] = None) -> Element:
         """
         Build an XML element for the FPL route waypoint.
 
+        If a parent element is given, the route waypoint element is created directly within it, rather than as a
+        standalone element that needs to be appended to a parent later.
+
+        :type parent: Element
+        :param parent: optional element to create route waypoint element within
         :rtype: Element
         :return: (L)XML element
         """
-        route_point = Element(f"{{{self.ns.fpl}}}route-point", nsmap=self.ns.nsmap())
+        route_point = (
+            Element(_route_point_tag, nsmap=_nsmap) if parent is None else SubElement(parent, _route_point_tag)
+        )
 
-        waypoint_identifier = SubElement(route_point, f"{{{self.ns.fpl}}}waypoint-identifier")
+        waypoint_identifier = SubElement(route_point, _waypoint_identifier_tag)
         waypoint_identifier.text = self.waypoint_reference
 
-        waypoint_type = SubElement(route_point, f"{{{self.ns.fpl}}}waypoint-type")
+        waypoint_type = SubElement(route_point, _waypoint_type_tag)
         waypoint_type.text = self.waypoint_type
 
-        waypoint_country_code = SubElement(route_point, f"{{{self.ns.fpl}}}waypoint-country-code")
+        waypoint_country_code = SubElement(route_point, _waypoint_country_code_tag)
         waypoint_country_code.text = self.waypoint_country_code
 
         return route_point
@@ -1,4 +1,8 @@
-import re
+from string import ascii_uppercase, digits
+
+_upper_alphanumeric = frozenset((ascii_uppercase + digits).encode("ascii"))
+_strip_non_upper_alphanumeric_space = bytes(c for c in range(256) if c not in _upper_alphanumeric and c != ord(" "))
+_strip_non_upper_alphanumeric = bytes(c for c in range(256) if c not in _upper_alphanumeric)
 
 
 def _upper_alphanumeric_space_only(value: str) -> str:
@@ -7,11 +11,14 @@ def _upper_alphanumeric_space_only(value: str) -> str:
 
     E.g. 'FOO bar 12' would become 'FOO  12' (double space as we don't post-process values).
 
+    Non-ASCII characters are never allowed so are dropped when encoding, remaining characters are then stripped in a
+    single pass using a precomputed table of disallowed bytes.
+
     :type value: str
     :param value: string to process
     :return: processed string
     """
-    return re.sub(r"[^A-Z\d ]+", "", value)
+    return value.encode("ascii", "ignore").translate(None, _strip_non_upper_alphanumeric_space).decode("ascii")
 
 
 def _upper_alphanumeric_only(value: str) -> str:
@@ -24,4 +31,4 @@ def _upper_alphanumeric_only(value: str) -> str:
     :param value: string to process
     :return: processed string
     """
-    return re.sub(r"[^A-Z\d]+", "", value)
+    return value.encode("ascii", "ignore").translate(None, _strip_non_upper_alphanumeric).decode("ascii")
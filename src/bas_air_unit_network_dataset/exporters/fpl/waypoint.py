@@ -1,15 +1,25 @@
 from __future__ import annotations
 
+from math import copysign
 from typing import Optional
 
 from lxml.etree import Element, SubElement
 
-from bas_air_unit_network_dataset.exporters.fpl import Namespaces, fpl_waypoint_types
+from bas_air_unit_network_dataset.exporters.fpl import Namespaces, fpl_waypoint_types, fpl_waypoint_types_ordered
 from bas_air_unit_network_dataset.exporters.fpl.utils import (
     _upper_alphanumeric_only,
     _upper_alphanumeric_space_only,
 )
 
+_waypoint_tag = f"{{{Namespaces.fpl}}}waypoint"
+_identifier_tag = f"{{{Namespaces.fpl}}}identifier"
+_type_tag = f"{{{Namespaces.fpl}}}type"
+_country_code_tag = f"{{{Namespaces.fpl}}}country-code"
+_lat_tag = f"{{{Namespaces.fpl}}}lat"
+_lon_tag = f"{{{Namespaces.fpl}}}lon"
+_comment_tag = f"{{{Namespaces.fpl}}}comment"
+_nsmap = Namespaces.nsmap()
+
 
 class Waypoint:
     """
@@ -18,6 +28,17 @@ class Waypoint:
     Concrete representation of an abstract waypoint using the FPL output format.
     """
 
+    __slots__ = (
+        "_identifier",
+        "_type",
+        "_country_code",
+        "_longitude",
+        "_longitude_text",
+        "_latitude",
+        "_latitude_text",
+        "_comment",
+    )
+
     max_identifier_length = 17
     max_country_code_length = 2
     max_comment_length = 25
@@ -47,13 +68,13 @@ class Waypoint:
         :type comment: str
         :param comment: Optional comment/description
         """
-        self.ns = Namespaces()
-
         self._identifier: str
         self._type: str
         self._country_code: str
         self._longitude: float
+        self._longitude_text: str
         self._latitude: float
+        self._latitude_text: str
         self._comment: Optional[str] = None
 
         if identifier is not None:
@@ -122,7 +143,7 @@ class Waypoint:
         """
         Set FPL waypoint type.
 
-        The FPL standard defines several types of waypoint defined in the `fpl_waypoint_types` list and which include:
+        The FPL standard defines several types of waypoint defined in the `fpl_waypoint_types` set and which include:
         - "USER WAYPOINT": user defined
         - "AIRPORT": airport
         - "INT": intersection
@@ -137,7 +158,7 @@ class Waypoint:
         :param waypoint_type: waypoint type, typically 'USER WAYPOINT'
         """
         if waypoint_type not in fpl_waypoint_types:
-            msg = f"Waypoint type must be one of {' '.join(fpl_waypoint_types)!r}"
+            msg = f"Waypoint type must be one of {' '.join(fpl_waypoint_types_ordered)!r}"
             raise ValueError(msg)
 
         self._type = waypoint_type
@@ -200,19 +221,21 @@ class Waypoint:
         **Note:** The FPL standard does not allow values to use `180.0` and `-180.0` exactly (for reasons best known to
         Garmin). This method will automatically convert values to be the closest values allowed (`±179.999999`).
 
+        Values are rounded to 7 decimal places when encoded, this text value is computed once here, rather than each
+        time the waypoint is encoded.
+
         :type longitude: float
         :param longitude: longitude component of waypoint geometry
         """
-        if -180 > longitude > 180:
+        if not -180 <= longitude <= 180:
             msg = "Longitude must be between -180 and +180."
             raise ValueError(msg)
 
-        if longitude == -180:
-            longitude = -179.999999
-        elif longitude == 180:
-            longitude = 179.999999
+        if abs(longitude) == 180:
+            longitude = copysign(179.999999, longitude)
 
         self._longitude = longitude
+        self._longitude_text = str(round(longitude, ndigits=7))
 
     @property
     def latitude(self) -> float:
@@ -235,19 +258,21 @@ class Waypoint:
         **Note:** The FPL standard does not allow values to use `90.0` and `-90.0` exactly (for reasons best known to
         Garmin). This method will automatically convert values to be the closest values allowed (`±89.999999`).
 
+        Values are rounded to 7 decimal places when encoded, this text value is computed once here, rather than each
+        time the waypoint is encoded.
+
         :type latitude: float
         :param latitude: latitude component of waypoint geometry
         """
-        if -90 > latitude > 90:
+        if not -90 <= latitude <= 90:
             msg = "Latitude must be between -90 and +90."
             raise ValueError(msg)
 
-        if latitude == 90:
-            latitude = 89.999999
-        elif latitude == -90:
-            latitude = -89.999999
+        if abs(latitude) == 90:
+            latitude = copysign(89.999999, latitude)
 
         self._latitude = latitude
+        self._latitude_text = str(round(latitude, ndigits=7))
 
     @property
     def comment(self) -> str:
@@ -257,9 +282,7 @@ class Waypoint:
         :rtype: str
         :returns waypoint comment
         """
-        if self._comment is None:
-            return "NO COMMENT"
-        return self._comment
+        return "NO COMMENT" if self._comment is None else self._comment
 
     @comment.setter
     def comment(self, comment: str) -> None:
@@ -285,32 +308,37 @@ class Waypoint:
 
         self._comment = _upper_alphanumeric_space_only(value=comment)
 
-    def encode(self) -> Element:
+    def encode(self, parent: Optional[Element] = None) -> Element:
         """
         Build an XML element for the FPL waypoint.
 
+        If a parent element is given, the waypoint element is created directly within it, rather than as a standalone
+        element that needs to be appended to a parent later.
+
+        :type parent: Element
+        :param parent: optional element to create waypoint element within
         :rtype: Element
         :return: (L)XML element
         """
-        waypoint = Element(f"{{{self.ns.fpl}}}waypoint", nsmap=self.ns.nsmap())
+        waypoint = Element(_waypoint_tag, nsmap=_nsmap) if parent is None else SubElement(parent, _waypoint_tag)
 
-        identifier = SubElement(waypoint, f"{{{self.ns.fpl}}}identifier")
+        identifier = SubElement(waypoint, _identifier_tag)
         identifier.text = self.identifier
 
-        waypoint_type = SubElement(waypoint, f"{{{self.ns.fpl}}}type")
+        waypoint_type = SubElement(waypoint, _type_tag)
         waypoint_type.text = self.waypoint_type
 
-        country_code = SubElement(waypoint, f"{{{self.ns.fpl}}}country-code")
+        country_code = SubElement(waypoint, _country_code_tag)
         country_code.text = self.country_code
 
-        latitude = SubElement(waypoint, f"{{{self.ns.fpl}}}lat")
-        latitude.text = str(round(self.latitude, ndigits=7))
+        latitude = SubElement(waypoint, _lat_tag)
+        latitude.text = self._latitude_text
 
-        longitude = SubElement(waypoint, f"{{{self.ns.fpl}}}lon")
-        longitude.text = str(round(self.longitude, ndigits=7))
+        longitude = SubElement(waypoint, _lon_tag)
+        longitude.text = self._longitude_text
 
         if self.comment is not None:
-            comment = SubElement(waypoint, f"{{{self.ns.fpl}}}comment")
+            comment = SubElement(waypoint, _comment_tag)
             comment.text = self.comment
 
         return waypoint
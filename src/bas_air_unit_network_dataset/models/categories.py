@@ -11,12 +11,10 @@ class Categories:
     def _make_categories(self, names: list[str]) -> None:
         unique_names_sorted = sorted({name for name in names if name is not None})
 
-        for i, name in enumerate(unique_names_sorted):
-            try:
-                colour = CATEGORY_COLOURS[i]
-            except IndexError:
-                colour = DEFAULT_CATEGORY_COLOUR
+        colours_count = len(CATEGORY_COLOURS)
 
+        for i, name in enumerate(unique_names_sorted):
+            colour = CATEGORY_COLOURS[i] if i < colours_count else DEFAULT_CATEGORY_COLOUR
             self._categories.append(Category(name=name, colour=colour))
 
     @property
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 
 from slugify import slugify
 
@@ -24,6 +25,12 @@ CATEGORY_COLOURS = [
 ]
 
 
+@lru_cache(maxsize=256)
+def _slugify(name: str) -> str:
+    """Generate slug for category name, cached as categories are rebuilt each time they're needed."""
+    return slugify(name)
+
+
 @dataclass
 class Category:
     """A label used to group or categorise a set of waypoints."""
@@ -33,4 +40,4 @@ class Category:
     weight: float = 0.4
 
     def __post_init__(self) -> None:
-        self.slug = slugify(self.name)
+        self.slug = _slugify(self.name)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import csv
-from collections import OrderedDict
 from pathlib import Path
 from typing import ClassVar, Optional, Union
 
@@ -15,6 +14,7 @@ from bas_air_unit_network_dataset.exporters.fpl.route_waypoint import (
 )
 from bas_air_unit_network_dataset.models.route_waypoint import RouteWaypoint
 from bas_air_unit_network_dataset.models.waypoint import Waypoint
+from bas_air_unit_network_dataset.utils import canonical_ulid
 
 
 class Route:
@@ -38,6 +38,11 @@ class Route:
     See the 'Information Model' section of the library README for more information.
     """
 
+    __slots__ = ("_id", "_name", "_waypoints")
+
+    # incremented whenever any route ID is set, so collections can detect when indexes may be stale
+    _identity_version: ClassVar[int] = 0
+
     feature_schema: ClassVar[dict] = {
         "geometry": "None",
         "properties": {"id": "str", "name": "str"},
@@ -48,24 +53,14 @@ class Route:
         "properties": {"id": "str", "name": "str"},
     }
 
-    # TODO: Determine why this needs an ordered dict
-    # https://gitlab.data.bas.ac.uk/MAGIC/air-unit-network-dataset/-/issues/205
+    # property order is significant (it sets the field order in outputs), dicts preserve insertion order [#205]
     feature_schema_waypoints_spatial: ClassVar[dict] = {
         "geometry": "Point",
-        "properties": OrderedDict(),
-    }
-    feature_schema_waypoints_spatial["properties"]["sequence"] = "int"
-    feature_schema_waypoints_spatial["properties"]["identifier"] = "str"
-    feature_schema_waypoints_spatial["properties"]["comment"] = "str"
-
-    csv_schema_waypoints: ClassVar[dict] = {
-        "sequence": "str",
-        "identifier": "str",
-        "name": "str",
-        "colocated_with": "str",
-        "comment": "str",
+        "properties": {"sequence": "int", "identifier": "str", "comment": "str"},
     }
 
+    csv_schema_waypoints: ClassVar[dict] = RouteWaypoint.csv_schema
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -81,7 +76,7 @@ class Route:
         :type route_waypoints: list
         :param route_waypoints: optional list of waypoints making up route, wrapped as RouteWaypoint objects
         """
-        self._id: str = str(ulid.new())
+        self._id: Optional[str] = None
 
         self._name: str
         self._waypoints: list[RouteWaypoint] = []
@@ -99,9 +94,14 @@ class Route:
 
         A unique and typically persistent value.
 
+        Assigned when first read, so that routes loaded from a feature (which set their own ID) do not generate one.
+
         :rtype: str
         :return: feature ID
         """
+        if self._id is None:
+            self._id = str(ulid.new())
+
         return self._id
 
     @fid.setter
@@ -117,7 +117,23 @@ class Route:
         :type _id: str
         :param _id: feature ID
         """
-        self._id = str(ulid.from_str(_id))
+        self._id = canonical_ulid(_id)
+        Route._identity_version += 1
+
+    def __getstate__(self) -> tuple[None, dict]:
+        """
+        Get route state for copying (and pickling).
+
+        As IDs are assigned when first read, an ID is assigned (if needed) before copying, so copies share the same ID
+        as the original route.
+
+        :rtype: tuple
+        :return: slot values, in the form expected by `copy` and `pickle` for classes using slots
+        """
+        state = {slot: getattr(self, slot) for slot in self.__slots__ if hasattr(self, slot)}
+        state["_id"] = self.fid
+
+        return None, state
 
     @property
     def name(self) -> str:
@@ -253,10 +269,10 @@ class Route:
         }
 
         if inc_spatial:
-            geometry = []
-            for route_waypoint in self.waypoints:
-                geometry.append(route_waypoint.waypoint.dumps_feature_geometry()["coordinates"])
-            feature["geometry"] = {"type": "LineString", "coordinates": geometry}
+            feature["geometry"] = {
+                "type": "LineString",
+                "coordinates": [route_waypoint.waypoint.coordinates for route_waypoint in self.waypoints],
+            }
 
         return feature
 
@@ -281,26 +297,18 @@ class Route:
         :rtype: list
         :return: feature for route waypoints
         """
-        _route_id = None
-        if inc_route_id:
-            _route_id = self.fid
+        route_id = self.fid if inc_route_id else None
+        route_name = self.name if inc_route_name else None
 
-        _route_name = None
-        if inc_route_name:
-            _route_name = self.name
-
-        features = []
-        for route_waypoint in self.waypoints:
-            features.append(
-                route_waypoint.dumps_feature(
-                    inc_spatial=inc_spatial,
-                    route_id=_route_id,
-                    route_name=_route_name,
-                    use_identifiers=use_identifiers,
-                )
+        return [
+            route_waypoint.dumps_feature(
+                inc_spatial=inc_spatial,
+                route_id=route_id,
+                route_name=route_name,
+                use_identifiers=use_identifiers,
             )
-
-        return features
+            for route_waypoint in self.waypoints
+        ]
 
     def dumps_feature(
         self,
@@ -364,21 +372,14 @@ class Route:
             msg = "Routes without waypoints cannot be dumped to CSV, set `inc_waypoints` to True."
             raise RuntimeError(msg)
 
-        csv_rows: list[dict] = []
-        for route_waypoint in self.waypoints:
-            route_waypoint_csv_row = route_waypoint.dumps_csv(
-                inc_dd_lat_lon=inc_dd_lat_lon, inc_ddm_lat_lon=inc_ddm_lat_lon
-            )
-
-            if route_column:
-                route_waypoint_csv_row = {
-                    **{"route_name": self.name},
-                    **route_waypoint_csv_row,
-                }
-
-            csv_rows.append(route_waypoint_csv_row)
+        route_name = self.name if route_column else None
 
-        return csv_rows
+        return [
+            route_waypoint.dumps_csv(
+                inc_dd_lat_lon=inc_dd_lat_lon, inc_ddm_lat_lon=inc_ddm_lat_lon, route_name=route_name
+            )
+            for route_waypoint in self.waypoints
+        ]
 
     def dump_csv(
         self,
@@ -404,62 +405,22 @@ class Route:
         :type inc_ddm_lat_lon: bool
         :param inc_ddm_lat_lon: include latitude and longitude columns in degrees decimal minutes format
         """
-        # this process is very inelegant and needs improving to remove duplication [#110]
-        fieldnames: list[str] = list(Route.csv_schema_waypoints.keys())
-        if inc_dd_lat_lon:
-            fieldnames = [
-                "sequence",
-                "identifier",
-                "name",
-                "colocated_with",
-                "latitude_dd",
-                "longitude_dd",
-                "last_accessed_at",
-                "last_accessed_by",
-                "comment",
-            ]
-        if inc_ddm_lat_lon:
-            fieldnames = [
-                "sequence",
-                "identifier",
-                "name",
-                "colocated_with",
-                "latitude_ddm",
-                "longitude_ddm",
-                "last_accessed_at",
-                "last_accessed_by",
-                "comment",
-            ]
-        if inc_dd_lat_lon and inc_ddm_lat_lon:
-            fieldnames = [
-                "sequence",
-                "identifier",
-                "name",
-                "colocated_with",
-                "latitude_dd",
-                "longitude_dd",
-                "latitude_ddm",
-                "longitude_ddm",
-                "last_accessed_at",
-                "last_accessed_by",
-                "comment",
-            ]
-
+        fieldnames = RouteWaypoint.csv_fieldnames(inc_dd_lat_lon=inc_dd_lat_lon, inc_ddm_lat_lon=inc_ddm_lat_lon)
         if route_column:
-            fieldnames = ["route_name", *fieldnames]
+            fieldnames = ("route_name", *fieldnames)
+
+        rows = self.dumps_csv(
+            inc_waypoints=inc_waypoints,
+            route_column=route_column,
+            inc_dd_lat_lon=inc_dd_lat_lon,
+            inc_ddm_lat_lon=inc_ddm_lat_lon,
+        )
 
         # newline parameter needed to avoid extra blank lines in files on Windows [#63]
         with path.open(mode="w", newline="", encoding="utf-8-sig") as output_file:
-            writer = csv.DictWriter(output_file, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(
-                self.dumps_csv(
-                    inc_waypoints=inc_waypoints,
-                    route_column=route_column,
-                    inc_dd_lat_lon=inc_dd_lat_lon,
-                    inc_ddm_lat_lon=inc_ddm_lat_lon,
-                )
-            )
+            writer = csv.writer(output_file)
+            writer.writerow(fieldnames)
+            writer.writerows([row[field] for field in fieldnames] for row in rows)
 
     def dumps_gpx(self, inc_waypoints: bool = False) -> GPX:
         """
@@ -474,15 +435,12 @@ class Route:
         route = GPXRoute()
 
         route.name = self.name
-
-        for route_waypoint in self.waypoints:
-            route.points.append(route_waypoint.dumps_gpx())
-
-            if inc_waypoints:
-                gpx.waypoints.append(route_waypoint.waypoint.dumps_gpx())
-
+        route.points = [route_waypoint.dumps_gpx() for route_waypoint in self.waypoints]
         gpx.routes.append(route)
 
+        if inc_waypoints:
+            gpx.waypoints = [route_waypoint.waypoint.dumps_gpx() for route_waypoint in self.waypoints]
+
         return gpx
 
     def dump_gpx(self, path: Path, inc_waypoints: bool = False) -> None:
@@ -538,8 +496,8 @@ class Route:
         :type flight_plan_index: int
         :param flight_plan_index: FPL index
         """
-        with path.open(mode="w") as xml_file:
-            xml_file.write(self.dumps_fpl(flight_plan_index=flight_plan_index).dumps_xml().decode())
+        fpl = self.dumps_fpl(flight_plan_index=flight_plan_index)
+        fpl.dump_xml(path=path)
 
     def __repr__(self) -> str:
         """Represent Route as a string."""
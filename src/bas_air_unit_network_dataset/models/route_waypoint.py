@@ -21,6 +21,8 @@ class RouteWaypoint:
     See the 'Information Model' section of the library README for more information.
     """
 
+    __slots__ = ("_waypoint", "_sequence")
+
     feature_schema: ClassVar[dict] = {
         "geometry": "None",
         "properties": {"route_id": "str", "waypoint_id": "str", "sequence": "int"},
@@ -31,6 +33,14 @@ class RouteWaypoint:
         "properties": feature_schema["properties"],
     }
 
+    csv_schema: ClassVar[dict] = {
+        "sequence": "str",
+        "identifier": "str",
+        "name": "str",
+        "colocated_with": "str",
+        "comment": "str",
+    }
+
     def __init__(self, waypoint: Optional[Waypoint] = None, sequence: Optional[int] = None) -> None:
         """
         Create or load a routes, optionally setting parameters.
@@ -111,12 +121,15 @@ class RouteWaypoint:
         :type waypoints: WaypointCollection
         :param waypoints: collection of waypoints from which to load waypoint information
         """
-        self.sequence = feature["properties"]["sequence"]
+        properties = feature["properties"]
+        waypoint_id = properties["waypoint_id"]
+
+        self.sequence = properties["sequence"]
 
         try:
-            self.waypoint = waypoints[feature["properties"]["waypoint_id"]]
+            self.waypoint = waypoints[waypoint_id]
         except KeyError as e:
-            msg = f"Waypoint with ID {feature['properties']['waypoint_id']!r} not found in available waypoints."
+            msg = f"Waypoint with ID {waypoint_id!r} not found in available waypoints."
             raise KeyError(msg) from e
 
     def dumps_feature(
@@ -140,61 +153,68 @@ class RouteWaypoint:
         :rtype: dict
         :return: feature for route waypoint
         """
-        feature = {
-            "geometry": None,
-            "properties": {"waypoint_id": self.waypoint.fid, "sequence": self.sequence},
-        }
+        properties = {}
+        if route_id is not None:
+            properties["route_id"] = route_id
+        if route_name is not None:
+            properties["route_name"] = route_name
+        if use_identifiers:
+            properties["identifier"] = self.waypoint.identifier
+        else:
+            properties["waypoint_id"] = self.waypoint.fid
+        properties["sequence"] = self.sequence
+
+        feature = {"geometry": None, "properties": properties}
 
         if inc_spatial:
-            geometry = {
-                "type": "Point",
-                "coordinates": (self.waypoint.geometry.x, self.waypoint.geometry.y),
-            }
-            if self.waypoint.geometry.has_z:
-                geometry["coordinates"] = (
-                    self.waypoint.geometry.x,
-                    self.waypoint.geometry.y,
-                    self.waypoint.geometry.z,
-                )
-            feature["geometry"] = geometry
+            feature["geometry"] = {"type": "Point", "coordinates": self.waypoint.coordinates}
 
-        if use_identifiers:
-            del feature["properties"]["waypoint_id"]
-            feature["properties"] = {
-                **{"identifier": self.waypoint.identifier},
-                **feature["properties"],
-            }
+        return feature
 
-        if route_name is not None:
-            feature["properties"] = {
-                **{"route_name": route_name},
-                **feature["properties"],
-            }
+    @staticmethod
+    def csv_fieldnames(inc_dd_lat_lon: bool = False, inc_ddm_lat_lon: bool = False) -> tuple[str, ...]:
+        """
+        Get CSV columns for route waypoints.
 
-        if route_id is not None:
-            feature["properties"] = {**{"route_id": route_id}, **feature["properties"]}
+        Columns are those in `csv_schema`, with any requested lat/lon columns inserted after 'colocated_with'.
 
-        return feature
+        :type inc_dd_lat_lon: bool
+        :param inc_dd_lat_lon: include latitude and longitude columns in decimal degree format
+        :type inc_ddm_lat_lon: bool
+        :param inc_ddm_lat_lon: include latitude and longitude columns in degrees decimal minutes format
+        :rtype: tuple
+        :return: CSV column names
+        """
+        return _csv_fieldnames[(inc_dd_lat_lon, inc_ddm_lat_lon)]
 
-    def dumps_csv(self, inc_dd_lat_lon: bool = False, inc_ddm_lat_lon: bool = False) -> dict[str, str]:
+    def dumps_csv(
+        self, inc_dd_lat_lon: bool = False, inc_ddm_lat_lon: bool = False, route_name: Optional[str] = None
+    ) -> dict[str, str]:
         """
         Build CSV data for route waypoint.
 
+        Columns are those returned by `csv_fieldnames()`, with values taken from the waypoint's CSV data (where null
+        values are represented as '-'). Other waypoint columns (such as fuel) are not included.
+
         :type inc_dd_lat_lon: bool
         :param inc_dd_lat_lon: include latitude and longitude columns in decimal degree format
         :type inc_ddm_lat_lon: bool
         :param inc_ddm_lat_lon: include latitude and longitude columns in degrees decimal minutes format
+        :type route_name: str
+        :param route_name: optional value to use for route name as an additional column
         :rtype: dict
         :return: row of generated CSV data for route waypoint
         """
-        route_waypoint = {"sequence": self.sequence}
-
         waypoint = self.waypoint.dumps_csv(inc_dd_lat_lon=inc_dd_lat_lon, inc_ddm_lat_lon=inc_ddm_lat_lon)
-        del waypoint["comment"]
-        del waypoint["last_accessed_at"]
-        del waypoint["last_accessed_by"]
+        waypoint["sequence"] = self.sequence
+
+        route_waypoint = {}
+        if route_name is not None:
+            route_waypoint["route_name"] = route_name
+        for column in self.csv_fieldnames(inc_dd_lat_lon=inc_dd_lat_lon, inc_ddm_lat_lon=inc_ddm_lat_lon):
+            route_waypoint[column] = waypoint[column]
 
-        return {**route_waypoint, **waypoint}
+        return route_waypoint
 
     def dumps_gpx(self) -> GPXRoutePoint:
         """
@@ -205,8 +225,21 @@ class RouteWaypoint:
         """
         route_waypoint = GPXRoutePoint()
         route_waypoint.name = self.waypoint.identifier
-        route_waypoint.longitude = self.waypoint.geometry.x
-        route_waypoint.latitude = self.waypoint.geometry.y
+        route_waypoint.longitude, route_waypoint.latitude = self.waypoint.coordinates
         route_waypoint.comment = self.waypoint.comment
 
         return route_waypoint
+
+
+# CSV columns for each combination of decimal degree (DD) and degrees decimal minutes (DDM) lat/lon columns
+_csv_columns = tuple(RouteWaypoint.csv_schema.keys())
+_csv_fieldnames: dict[tuple[bool, bool], tuple[str, ...]] = {
+    (inc_dd, inc_ddm): (
+        *_csv_columns[:4],
+        *(("latitude_dd", "longitude_dd") if inc_dd else ()),
+        *(("latitude_ddm", "longitude_ddm") if inc_ddm else ()),
+        *_csv_columns[4:],
+    )
+    for inc_dd in (False, True)
+    for inc_ddm in (False, True)
+}
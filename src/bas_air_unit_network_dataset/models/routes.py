@@ -3,10 +3,20 @@ from __future__ import annotations
 import csv
 from collections.abc import Iterator
 from pathlib import Path
+from typing import Optional
 
 from gpxpy.gpx import GPX
 
 from bas_air_unit_network_dataset.models.route import Route
+from bas_air_unit_network_dataset.models.route_waypoint import RouteWaypoint
+
+# CSV columns for all routes combined into a single file, for each combination of decimal degree (DD) and degrees
+# decimal minutes (DDM) lat/lon columns
+_csv_fieldnames_combined: dict[tuple[bool, bool], tuple[str, ...]] = {
+    (inc_dd, inc_ddm): ("route_name", *RouteWaypoint.csv_fieldnames(inc_dd_lat_lon=inc_dd, inc_ddm_lat_lon=inc_ddm))
+    for inc_dd in (False, True)
+    for inc_ddm in (False, True)
+}
 
 
 class RouteCollection:
@@ -19,6 +29,8 @@ class RouteCollection:
     def __init__(self) -> None:
         """Create routes collection."""
         self._routes: list[Route] = []
+        self._routes_by_id: Optional[dict[str, Route]] = None
+        self._routes_by_id_version: int = Route._identity_version
 
     @property
     def routes(self) -> list[Route]:
@@ -34,22 +46,28 @@ class RouteCollection:
         """
         Add route to collection.
 
+        If routes have been indexed by ID, the index is updated with the new route.
+
         :type route: Route
         :param route: additional route
         """
         self._routes.append(route)
 
-    def dumps_features(
+        if self._routes_by_id is not None:
+            self._routes_by_id.setdefault(route.fid, route)
+
+    def iter_features(
         self,
         inc_spatial: bool = True,
         inc_waypoints: bool = False,
         inc_route_id: bool = False,
         inc_route_name: bool = False,
-    ) -> list[dict]:
+    ) -> Iterator[dict]:
         """
-        Build all routes in collection as generic features for further processing.
+        Generate all routes in collection as generic features, one at a time, for further processing.
 
-        This method is a wrapper around the `dumps_feature()` method for each route.
+        Features are built lazily so that consumers (e.g. a feature writer) can stream them without holding every
+        feature in memory.
 
         :type inc_spatial: bool
         :param inc_spatial: whether to include the geometry of each route in generated features
@@ -59,23 +77,51 @@ class RouteCollection:
         :param inc_route_id: whether to include the route identifier as an additional feature property
         :type inc_route_name: bool
         :param inc_route_name: whether to include the route name as an additional feature property
-        :rtype: list
+        :rtype: Iterator
         :return: features for routes or route waypoints, for each route in collection
         """
-        features = []
-
         for route in self.routes:
             if not inc_waypoints:
-                features.append(route.dumps_feature(inc_spatial=inc_spatial, inc_waypoints=False))
+                yield route.dumps_feature(inc_spatial=inc_spatial, inc_waypoints=False)
                 continue
-            features += route.dumps_feature(
+            yield from route.dumps_feature(
                 inc_spatial=inc_spatial,
                 inc_waypoints=True,
                 inc_route_id=inc_route_id,
                 inc_route_name=inc_route_name,
             )
 
-        return features
+    def dumps_features(
+        self,
+        inc_spatial: bool = True,
+        inc_waypoints: bool = False,
+        inc_route_id: bool = False,
+        inc_route_name: bool = False,
+    ) -> list[dict]:
+        """
+        Build all routes in collection as generic features for further processing.
+
+        This method is a wrapper around the `iter_features()` method.
+
+        :type inc_spatial: bool
+        :param inc_spatial: whether to include the geometry of each route in generated features
+        :type inc_waypoints: bool
+        :param inc_waypoints: whether to generate a single feature for the route, or features for each route waypoint
+        :type inc_route_id: bool
+        :param inc_route_id: whether to include the route identifier as an additional feature property
+        :type inc_route_name: bool
+        :param inc_route_name: whether to include the route name as an additional feature property
+        :rtype: list
+        :return: features for routes or route waypoints, for each route in collection
+        """
+        return list(
+            self.iter_features(
+                inc_spatial=inc_spatial,
+                inc_waypoints=inc_waypoints,
+                inc_route_id=inc_route_id,
+                inc_route_name=inc_route_name,
+            )
+        )
 
     def _dump_csv_separate(self, path: Path, inc_dd_lat_lon: bool = False, inc_ddm_lat_lon: bool = False) -> None:
         """
@@ -108,22 +154,25 @@ class RouteCollection:
         :type inc_ddm_lat_lon: bool
         :param inc_ddm_lat_lon: include latitude and longitude columns in degrees decimal minutes format
         """
-        fieldnames: list[str] = ["route_name", *list(Route.csv_schema_waypoints.keys())]
+        fieldnames = _csv_fieldnames_combined[(inc_dd_lat_lon, inc_ddm_lat_lon)]
 
-        route_waypoints: list[dict] = []
-        for route in self.routes:
-            route_waypoints += route.dumps_csv(
+        # rows are generated per route as they are written, rather than collected for all routes first
+        route_waypoints = (
+            row
+            for route in self.routes
+            for row in route.dumps_csv(
                 inc_waypoints=True,
                 route_column=True,
                 inc_dd_lat_lon=inc_dd_lat_lon,
                 inc_ddm_lat_lon=inc_ddm_lat_lon,
             )
+        )
 
         # newline parameter needed to avoid extra blank lines in files on Windows [#63]
         with path.open(mode="w", newline="", encoding="utf-8-sig") as output_file:
-            writer = csv.DictWriter(output_file, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(route_waypoints)
+            writer = csv.writer(output_file)
+            writer.writerow(fieldnames)
+            writer.writerows([row[field] for field in fieldnames] for row in route_waypoints)
 
     def dump_csv(
         self,
@@ -167,16 +216,11 @@ class RouteCollection:
         :return: generated GPX file containing all routes in collection
         """
         gpx = GPX()
-        _waypoints = []
 
         for route in self.routes:
-            gpx.routes.append(route.dumps_gpx(inc_waypoints=False).routes[0])
-
-            if inc_waypoints:
-                _waypoints += route.dumps_gpx(inc_waypoints=True).waypoints
-
-        if inc_waypoints:
-            gpx.waypoints = _waypoints
+            route_gpx = route.dumps_gpx(inc_waypoints=inc_waypoints)
+            gpx.routes += route_gpx.routes
+            gpx.waypoints += route_gpx.waypoints
 
         return gpx
 
@@ -226,6 +270,10 @@ class RouteCollection:
         """
         Get a Route by its ID.
 
+        Routes are indexed by ID when first needed, and the index is then updated as routes are appended. As route IDs
+        can be changed after routes are indexed, the index is discarded and rebuilt if any route ID has been set since
+        it was built. Where IDs are duplicated, the first route is returned.
+
         :type _id: Route
         :param _id: a route ID (distinct from a route's Identifier)
         :rtype Route
@@ -233,11 +281,13 @@ class RouteCollection:
 
         :raises KeyError: if no route exists with the requested ID
         """
-        for route in self.routes:
-            if route.fid == _id:
-                return route
+        if self._routes_by_id is None or self._routes_by_id_version != Route._identity_version:
+            self._routes_by_id = {}
+            self._routes_by_id_version = Route._identity_version
+            for route in self._routes:
+                self._routes_by_id.setdefault(route.fid, route)
 
-        raise KeyError(_id)
+        return self._routes_by_id[_id]
 
     def __iter__(self) -> Iterator[Route]:
         """Iterate through each Route within RouteCollection."""
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import date
 from typing import ClassVar, Optional
 
@@ -9,7 +10,7 @@ from shapely.geometry import Point
 
 from bas_air_unit_network_dataset.exporters.fpl.waypoint import Waypoint as FplWaypoint
 from bas_air_unit_network_dataset.exporters.report.waypoint import WaypointsReportWaypoint
-from bas_air_unit_network_dataset.utils import convert_coordinate_dd_2_ddm
+from bas_air_unit_network_dataset.utils import canonical_ulid, convert_coordinate_dd_2_ddm
 
 
 class Waypoint:
@@ -30,6 +31,24 @@ class Waypoint:
     See the 'Information Model' section of the library README for more information.
     """
 
+    __slots__ = (
+        "_id",
+        "_identifier",
+        "_geometry",
+        "_geometry_coordinates",
+        "_name",
+        "_colocated_with",
+        "_last_accessed_at",
+        "_last_accessed_by",
+        "_fuel",
+        "_elevation_ft",
+        "_comment",
+        "_category",
+    )
+
+    # incremented whenever any waypoint identifier or ID is set, so collections can detect when indexes may be stale
+    _identity_version: ClassVar[int] = 0
+
     identifier_max_length = 6
     name_max_length = 17
 
@@ -92,10 +111,11 @@ class Waypoint:
         :param comment: free-text descriptive comment for waypoint
         :param category: single free-text group for waypoint
         """
-        self._id: str = str(ulid.new())
+        self._id: Optional[str] = None
 
         self._identifier: str
-        self._geometry: Point
+        self._geometry: Optional[Point] = None
+        self._geometry_coordinates: tuple[float, ...]
         self._name: Optional[str] = None
         self._colocated_with: Optional[str] = None
         self._last_accessed_at: Optional[date] = None
@@ -117,9 +137,7 @@ class Waypoint:
         if colocated_with is not None:
             self.colocated_with = colocated_with
 
-        if (last_accessed_at is not None and last_accessed_by is None) or (
-            last_accessed_at is None and last_accessed_by is not None
-        ):
+        if (last_accessed_at is None) != (last_accessed_by is None):
             msg = "A `last_accessed_at` and `last_accessed_by` value must be provided."
             raise ValueError(msg)
 
@@ -144,7 +162,12 @@ class Waypoint:
         Waypoint feature ID.
 
         A unique and typically persistent value.
+
+        Assigned when first read, so that waypoints loaded from a feature (which set their own ID) do not generate one.
         """
+        if self._id is None:
+            self._id = str(ulid.new())
+
         return self._id
 
     @fid.setter
@@ -159,7 +182,20 @@ class Waypoint:
 
         :param _id: feature ID
         """
-        self._id = str(ulid.from_str(_id))
+        self._id = canonical_ulid(_id)
+        Waypoint._identity_version += 1
+
+    def __getstate__(self) -> tuple[None, dict]:
+        """
+        Get waypoint state for copying (and pickling).
+
+        As IDs are assigned when first read, an ID is assigned (if needed) before copying, so copies share the same ID
+        as the original waypoint.
+        """
+        state = {slot: getattr(self, slot) for slot in self.__slots__ if hasattr(self, slot)}
+        state["_id"] = self.fid
+
+        return None, state
 
     @property
     def identifier(self) -> str:
@@ -191,6 +227,7 @@ class Waypoint:
             raise ValueError(msg)
 
         self._identifier = identifier
+        Waypoint._identity_version += 1
 
     @property
     def geometry(self) -> Point:
@@ -198,29 +235,45 @@ class Waypoint:
         Waypoint geometry.
 
         Geometries use the EPSG:4326 CRS.
+
+        The Point is built when first read, as the waypoint's own methods only need its coordinates.
         """
+        if self._geometry is None:
+            self._geometry = Point(*self._geometry_coordinates)
+
         return self._geometry
 
     @geometry.setter
-    def geometry(self, geometry: list[float]) -> None:
+    def geometry(self, geometry: Sequence[float]) -> None:
         """
         Set waypoint geometry.
 
         Values should be in [longitude, latitude] axis order using the EPSG:4326 CRS.
 
-        :param geometry: waypoint geometry as a list of longitude/latitude values
+        :param geometry: waypoint geometry as a sequence (e.g. list or tuple) of longitude/latitude values
         """
         lon = geometry[0]
         lat = geometry[1]
 
-        if -180 > lon > 180:
+        if not -180 <= lon <= 180:
             msg = "Longitude must be between -180 and +180."
             raise ValueError(msg)
-        if -90 > lat > 90:
+        if not -90 <= lat <= 90:
             msg = "Latitude must be between -90 and +90."
             raise ValueError(msg)
 
-        self._geometry = Point(lon, lat)
+        self._geometry = None
+        self._geometry_coordinates = (float(lon), float(lat))
+
+    @property
+    def coordinates(self) -> tuple[float, ...]:
+        """
+        Waypoint geometry as a tuple of coordinates.
+
+        Coordinates are in (longitude, latitude) axis order using the EPSG:4326 CRS. Unlike `geometry`, reading this
+        property does not require building a shapely Point.
+        """
+        return self._geometry_coordinates
 
     @property
     def name(self) -> Optional[str]:
@@ -386,34 +439,36 @@ class Waypoint:
 
         :param feature: feature representing a Waypoint
         """
-        self.fid = feature["properties"]["id"]
-        self.identifier = feature["properties"]["identifier"]
-        self.geometry = list(feature["geometry"]["coordinates"])
-
-        if feature["properties"]["name"] is not None:
-            self.name = feature["properties"]["name"]
-        if feature["properties"]["colocated_with"] is not None:
-            self.colocated_with = feature["properties"]["colocated_with"]
-        if feature["properties"]["last_accessed_at"] is not None and feature["properties"]["last_accessed_by"] is None:
-            msg = "A `last_accessed_by` value must be provided if `last_accessed_at` is set."
-            raise ValueError(msg)
-        if feature["properties"]["last_accessed_at"] is None and feature["properties"]["last_accessed_by"] is not None:
-            msg = "A `last_accessed_at` value must be provided if `last_accessed_by` is set."
+        properties = feature["properties"]
+        last_accessed_at = properties["last_accessed_at"]
+        last_accessed_by = properties["last_accessed_by"]
+
+        self.fid = properties["id"]
+        self.identifier = properties["identifier"]
+        self.geometry = feature["geometry"]["coordinates"]
+
+        if properties["name"] is not None:
+            self.name = properties["name"]
+        if properties["colocated_with"] is not None:
+            self.colocated_with = properties["colocated_with"]
+        if (last_accessed_at is None) != (last_accessed_by is None):
+            msg = (
+                "A `last_accessed_by` value must be provided if `last_accessed_at` is set."
+                if last_accessed_by is None
+                else "A `last_accessed_at` value must be provided if `last_accessed_by` is set."
+            )
             raise ValueError(msg)
-        if (
-            feature["properties"]["last_accessed_at"] is not None
-            and feature["properties"]["last_accessed_by"] is not None
-        ):
-            self.last_accessed_at = date.fromisoformat(feature["properties"]["last_accessed_at"])
-            self.last_accessed_by = feature["properties"]["last_accessed_by"]
-        if feature["properties"]["fuel"] is not None:
-            self.fuel = feature["properties"]["fuel"]
-        if feature["properties"]["elevation_ft"] is not None:
-            self.elevation_ft = feature["properties"]["elevation_ft"]
-        if feature["properties"]["comment"] is not None:
-            self.comment = feature["properties"]["comment"]
-        if feature["properties"]["category"] is not None:
-            self.category = feature["properties"]["category"]
+        if last_accessed_at is not None:
+            self.last_accessed_at = date.fromisoformat(last_accessed_at)
+            self.last_accessed_by = last_accessed_by
+        if properties["fuel"] is not None:
+            self.fuel = properties["fuel"]
+        if properties["elevation_ft"] is not None:
+            self.elevation_ft = properties["elevation_ft"]
+        if properties["comment"] is not None:
+            self.comment = properties["comment"]
+        if properties["category"] is not None:
+            self.category = properties["category"]
 
     def loads_gpx(self, gpx_waypoint: GPXWaypoint) -> None:
         """
@@ -458,16 +513,12 @@ class Waypoint:
             self.category = category
 
     def dumps_feature_geometry(self) -> dict:
-        """Build waypoint geometry for use in a generic feature."""
-        geometry = {"type": "Point", "coordinates": (self.geometry.x, self.geometry.y)}
-        if self.geometry.has_z:
-            geometry["coordinates"] = (
-                self.geometry.x,
-                self.geometry.y,
-                self.geometry.z,
-            )
+        """
+        Build waypoint geometry for use in a generic feature.
 
-        return geometry
+        Coordinates are taken from the tuple stored when the geometry is set, rather than read back from the geometry.
+        """
+        return {"type": "Point", "coordinates": self._geometry_coordinates}
 
     def dumps_feature(self, inc_spatial: bool = True) -> dict:
         """
@@ -475,19 +526,20 @@ class Waypoint:
 
         :param inc_spatial: whether to include the geometry of the route and/or route waypoints in generated features
         """
+        # attributes are read directly, rather than through their (plain) getters, as this is called for every waypoint
         feature = {
             "geometry": None,
             "properties": {
                 "id": self.fid,
-                "identifier": self.identifier,
-                "name": self.name,
-                "colocated_with": self.colocated_with,
-                "last_accessed_at": self.last_accessed_at,
-                "last_accessed_by": self.last_accessed_by,
-                "fuel": self.fuel,
-                "elevation_ft": self.elevation_ft,
-                "comment": self.comment,
-                "category": self.category,
+                "identifier": self._identifier,
+                "name": self._name,
+                "colocated_with": self._colocated_with,
+                "last_accessed_at": self._last_accessed_at,
+                "last_accessed_by": self._last_accessed_by,
+                "fuel": self._fuel,
+                "elevation_ft": self._elevation_ft,
+                "comment": self._comment,
+                "category": self._category,
             },
         }
 
@@ -496,69 +548,37 @@ class Waypoint:
 
         return feature
 
-    def dumps_csv(self, inc_dd_lat_lon: bool = False, inc_ddm_lat_lon: bool = False) -> dict:  # noqa: C901
+    def dumps_csv(self, inc_dd_lat_lon: bool = False, inc_ddm_lat_lon: bool = False) -> dict:
         """
         Build CSV data row for waypoint.
 
+        Null values are represented as '-'. Lat/lon columns (and their conversion to DDM) are only built if requested.
+
         :param inc_dd_lat_lon: include latitude and longitude columns in decimal degree format
         :param inc_ddm_lat_lon: include latitude and longitude columns in degrees decimal minutes format
         """
-        geometry_ddm = convert_coordinate_dd_2_ddm(lon=self.geometry.x, lat=self.geometry.y)
-
-        name = "-"
-        if self.name is not None:
-            name = self.name
-
-        colocated_with = "-"
-        if self.colocated_with is not None:
-            colocated_with = self.colocated_with
-
-        last_accessed_at = "-"
-        if self.last_accessed_at is not None:
-            last_accessed_at = self.last_accessed_at.isoformat()
-
-        last_accessed_by = "-"
-        if self.last_accessed_by is not None:
-            last_accessed_by = self.last_accessed_by
-
-        fuel = "-"
-        if self.fuel is not None:
-            fuel = self.fuel
-
-        elevation_ft = "-"
-        if self.elevation_ft is not None:
-            elevation_ft = self.elevation_ft
-
-        comment = "-"
-        if self.comment is not None:
-            comment = self.comment
-
-        category = "-"
-        if self.category is not None:
-            category = self.category
+        lon, lat = self._geometry_coordinates
 
         csv_feature = {
             "identifier": self.identifier,
-            "name": name,
-            "colocated_with": colocated_with,
-            "latitude_dd": self.geometry.y,
-            "longitude_dd": self.geometry.x,
-            "latitude_ddm": geometry_ddm["lat"],
-            "longitude_ddm": geometry_ddm["lon"],
-            "last_accessed_at": last_accessed_at,
-            "last_accessed_by": last_accessed_by,
-            "fuel": fuel,
-            "elevation_ft": elevation_ft,
-            "comment": comment,
-            "category": category,
+            "name": "-" if self.name is None else self.name,
+            "colocated_with": "-" if self.colocated_with is None else self.colocated_with,
         }
 
-        if not inc_dd_lat_lon:
-            del csv_feature["latitude_dd"]
-            del csv_feature["longitude_dd"]
-        if not inc_ddm_lat_lon:
-            del csv_feature["latitude_ddm"]
-            del csv_feature["longitude_ddm"]
+        if inc_dd_lat_lon:
+            csv_feature["latitude_dd"] = lat
+            csv_feature["longitude_dd"] = lon
+        if inc_ddm_lat_lon:
+            geometry_ddm = convert_coordinate_dd_2_ddm(lon=lon, lat=lat)
+            csv_feature["latitude_ddm"] = geometry_ddm["lat"]
+            csv_feature["longitude_ddm"] = geometry_ddm["lon"]
+
+        csv_feature["last_accessed_at"] = "-" if self.last_accessed_at is None else self.last_accessed_at.isoformat()
+        csv_feature["last_accessed_by"] = "-" if self.last_accessed_by is None else self.last_accessed_by
+        csv_feature["fuel"] = "-" if self.fuel is None else self.fuel
+        csv_feature["elevation_ft"] = "-" if self.elevation_ft is None else self.elevation_ft
+        csv_feature["comment"] = "-" if self.comment is None else self.comment
+        csv_feature["category"] = "-" if self.category is None else self.category
 
         return csv_feature
 
@@ -573,8 +593,7 @@ class Waypoint:
         """
         waypoint = GPXWaypoint()
         waypoint.name = self.identifier
-        waypoint.longitude = self.geometry.x
-        waypoint.latitude = self.geometry.y
+        waypoint.longitude, waypoint.latitude = self._geometry_coordinates
         waypoint.description = self.name
 
         return waypoint
@@ -596,8 +615,7 @@ class Waypoint:
         waypoint.identifier = self.identifier
         waypoint.waypoint_type = "USER WAYPOINT"
         waypoint.country_code = "__"
-        waypoint.longitude = self.geometry.x
-        waypoint.latitude = self.geometry.y
+        waypoint.longitude, waypoint.latitude = self._geometry_coordinates
 
         if self.name is not None:
             waypoint.comment = self.name.upper()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import csv
 from collections.abc import Iterator
 from datetime import datetime, timezone
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from typing import Optional
 
@@ -15,6 +16,32 @@ from bas_air_unit_network_dataset.exporters.report.waypoint import WaypointsRepo
 from bas_air_unit_network_dataset.models.categories import Categories
 from bas_air_unit_network_dataset.models.waypoint import Waypoint
 
+# CSV columns for each combination of decimal degree (DD) and degrees decimal minutes (DDM) lat/lon columns
+_csv_columns = list(Waypoint.csv_schema.keys())
+_csv_fieldnames: dict[tuple[bool, bool], tuple[str, ...]] = {
+    (inc_dd, inc_ddm): (
+        *_csv_columns[:3],
+        *(("latitude_dd", "longitude_dd") if inc_dd else ()),
+        *(("latitude_ddm", "longitude_ddm") if inc_ddm else ()),
+        *_csv_columns[3:],
+    )
+    for inc_dd in (False, True)
+    for inc_ddm in (False, True)
+}
+
+
+def _index_waypoint(index: dict[str, Waypoint], attribute: str, waypoint: Waypoint) -> None:
+    """
+    Add waypoint to an index by attribute, unless already indexed or the waypoint does not have a value.
+
+    :param index: waypoints indexed by attribute
+    :param attribute: waypoint attribute name
+    :param waypoint: waypoint to index
+    """
+    value = getattr(waypoint, attribute, None)
+    if value is not None:
+        index.setdefault(value, waypoint)
+
 
 class WaypointCollection:
     """
@@ -27,10 +54,21 @@ class WaypointCollection:
     def __init__(self) -> None:
         """Create routes collection."""
         self._waypoints: list[Waypoint] = []
+        self._waypoints_sorted: bool = True
+        self._waypoints_indexes: dict[str, dict[str, Waypoint]] = {}
+        self._waypoints_indexes_version: int = Waypoint._identity_version
 
     @property
     def waypoints(self) -> list[Waypoint]:
-        """Get all waypoints in collection as Waypoint classes."""
+        """
+        Get all waypoints in collection as Waypoint classes.
+
+        Waypoints are sorted by identifier, if needed, when read.
+        """
+        if not self._waypoints_sorted:
+            self._waypoints.sort(key=attrgetter("identifier"))
+            self._waypoints_sorted = True
+
         return self._waypoints
 
     @property
@@ -51,24 +89,52 @@ class WaypointCollection:
         """
         Add waypoint to collection.
 
-        For consistency waypoints are sorted by identifier.
+        For consistency waypoints are sorted by identifier. To avoid sorting the collection on each append (e.g. when
+        loading many waypoints), waypoints are sorted once when next read.
+
+        Any lookup indexes are updated with the new waypoint.
         """
         self._waypoints.append(waypoint)
-        self._waypoints = sorted(self.waypoints, key=lambda x: x.identifier)
+        self._waypoints_sorted = False
+
+        for attribute, index in self._waypoints_indexes.items():
+            _index_waypoint(index=index, attribute=attribute, waypoint=waypoint)
+
+    def _index(self, attribute: str) -> dict[str, Waypoint]:
+        """
+        Get waypoints in collection indexed by an attribute.
+
+        Indexes are built when first needed and are then updated as waypoints are appended. As waypoint identifiers and
+        IDs can be changed after waypoints are indexed, indexes are discarded and rebuilt if any waypoint identifier or
+        ID has been set since they were built. Lookups for values not in the collection therefore do not rebuild
+        indexes unless a waypoint has changed.
+
+        Where values are duplicated, the first waypoint in the collection is indexed.
+
+        :param attribute: waypoint attribute name
+        """
+        if self._waypoints_indexes_version != Waypoint._identity_version:
+            self._waypoints_indexes.clear()
+            self._waypoints_indexes_version = Waypoint._identity_version
+
+        index = self._waypoints_indexes.get(attribute)
+        if index is None:
+            index = {}
+            for waypoint in self._waypoints:
+                _index_waypoint(index=index, attribute=attribute, waypoint=waypoint)
+            self._waypoints_indexes[attribute] = index
+
+        return index
 
     def lookup(self, identifier: str) -> Optional[Waypoint]:
         """
         Get waypoint in collection specified by waypoint identifier.
 
-        Returns `None` if no matching waypoint found.
+        Returns `None` if no matching waypoint found. Where identifiers are duplicated, the first waypoint is returned.
 
         :param identifier: waypoint identifier
         """
-        for waypoint in self._waypoints:
-            if waypoint.identifier == identifier:
-                return waypoint
-
-        return None
+        return self._index(attribute="identifier").get(identifier)
 
     def loads_gpx(self, gpx_waypoints: list[GPXWaypoint]) -> None:
         """
@@ -82,20 +148,27 @@ class WaypointCollection:
 
             self.append(waypoint)
 
-    def dump_features(self, inc_spatial: bool = True) -> list[dict]:
+    def iter_features(self, inc_spatial: bool = True) -> Iterator[dict]:
         """
-        Build all waypoints in collection as generic features for further processing.
+        Generate waypoints in collection as generic features, one at a time, for further processing.
 
-        This method is a wrapper around the `dumps_feature()` method for each waypoint.
+        Features are built lazily so that consumers (e.g. a feature writer) can stream them without holding every
+        feature in memory.
 
         :param inc_spatial: whether to include the geometry of each waypoint in generated features
         """
-        features = []
-
         for waypoint in self.waypoints:
-            features.append(waypoint.dumps_feature(inc_spatial=inc_spatial))
+            yield waypoint.dumps_feature(inc_spatial=inc_spatial)
 
-        return features
+    def dump_features(self, inc_spatial: bool = True) -> list[dict]:
+        """
+        Build all waypoints in collection as generic features for further processing.
+
+        This method is a wrapper around the `iter_features()` method.
+
+        :param inc_spatial: whether to include the geometry of each waypoint in generated features
+        """
+        return list(self.iter_features(inc_spatial=inc_spatial))
 
     def dump_csv(self, path: Path, inc_dd_lat_lon: bool = False, inc_ddm_lat_lon: bool = False) -> None:
         """
@@ -105,66 +178,24 @@ class WaypointCollection:
         :param inc_dd_lat_lon: include latitude and longitude columns in decimal degree format
         :param inc_ddm_lat_lon: include latitude and longitude columns in degrees decimal minutes format
         """
-        fieldnames: list[str] = list(Waypoint.csv_schema.keys())
-        if inc_dd_lat_lon:
-            fieldnames = [
-                "identifier",
-                "name",
-                "colocated_with",
-                "latitude_dd",
-                "longitude_dd",
-                "last_accessed_at",
-                "last_accessed_by",
-                "fuel",
-                "elevation_ft",
-                "comment",
-                "category",
-            ]
-        if inc_ddm_lat_lon:
-            fieldnames = [
-                "identifier",
-                "name",
-                "colocated_with",
-                "latitude_ddm",
-                "longitude_ddm",
-                "last_accessed_at",
-                "last_accessed_by",
-                "fuel",
-                "elevation_ft",
-                "comment",
-                "category",
-            ]
-        if inc_dd_lat_lon and inc_ddm_lat_lon:
-            fieldnames = [
-                "identifier",
-                "name",
-                "colocated_with",
-                "latitude_dd",
-                "longitude_dd",
-                "latitude_ddm",
-                "longitude_ddm",
-                "last_accessed_at",
-                "last_accessed_by",
-                "fuel",
-                "elevation_ft",
-                "comment",
-                "category",
-            ]
+        fieldnames = _csv_fieldnames[(inc_dd_lat_lon, inc_ddm_lat_lon)]
+
+        # rows are written positionally, in fieldname order, to avoid `csv.DictWriter` checking each row for extra keys
+        row_values = itemgetter(*fieldnames)
 
         # newline parameter needed to avoid extra blank lines in files on Windows [#63]
         with path.open(mode="w", newline="", encoding="utf-8-sig") as output_file:
-            writer = csv.DictWriter(output_file, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for waypoint in self.waypoints:
-                writer.writerow(waypoint.dumps_csv(inc_dd_lat_lon=inc_dd_lat_lon, inc_ddm_lat_lon=inc_ddm_lat_lon))
+            writer = csv.writer(output_file)
+            writer.writerow(fieldnames)
+            writer.writerows(
+                row_values(waypoint.dumps_csv(inc_dd_lat_lon=inc_dd_lat_lon, inc_ddm_lat_lon=inc_ddm_lat_lon))
+                for waypoint in self.waypoints
+            )
 
     def dumps_gpx(self) -> GPX:
         """Build a GPX document for all waypoints within collection."""
         gpx = GPX()
-
-        for waypoint in self.waypoints:
-            gpx.waypoints.append(waypoint.dumps_gpx())
+        gpx.waypoints = [waypoint.dumps_gpx() for waypoint in self.waypoints]
 
         return gpx
 
@@ -176,10 +207,7 @@ class WaypointCollection:
     def dumps_fpl(self) -> Fpl:
         """Build a FPL document for all waypoints within collection."""
         fpl = Fpl()
-
-        for waypoint in self.waypoints:
-            fpl.waypoints.append(waypoint.dumps_fpl())
-
+        fpl.waypoints = [waypoint.dumps_fpl() for waypoint in self.waypoints]
         fpl.validate()
 
         return fpl
@@ -231,15 +259,11 @@ class WaypointCollection:
         :param _id: a waypoint ID (distinct from a waypoint's Identifier)
         :raises KeyError: if no Waypoint exists with the requested ID
         """
-        for waypoint in self._waypoints:
-            if waypoint.fid == _id:
-                return waypoint
-
-        raise KeyError(_id)
+        return self._index(attribute="fid")[_id]
 
     def __iter__(self) -> Iterator[Waypoint]:
         """Iterate through each Waypoint within WaypointCollection."""
-        return self._waypoints.__iter__()
+        return self.waypoints.__iter__()
 
     def __len__(self) -> int:
         """Waypoints in WaypointCollection."""
@@ -1,11 +1,26 @@
 from __future__ import annotations
 
-from contextlib import suppress
-from datetime import datetime, timezone
-from typing import Union
+import re
+from functools import lru_cache
+from math import modf
+from time import gmtime, strftime, time
+from typing import NamedTuple
 
+import ulid
 
-def _convert_coordinate_dd_2_ddm(coordinate: float, positive_symbol: str, negative_symbol: str) -> dict[str, float]:
+# canonical ULID representation, 26 upper case Crockford base32 characters with a leading 0-7 to fit in 128 bits
+_ulid_pattern = re.compile(r"[0-7][0-9A-HJKMNP-TV-Z]{25}")
+
+
+class _DdmCoordinate(NamedTuple):
+    """Coordinate axis value split into whole degrees, decimal minutes and hemisphere symbol."""
+
+    degree: int
+    minutes: float
+    sign: str
+
+
+def _convert_coordinate_dd_2_ddm(coordinate: float, positive_symbol: str, negative_symbol: str) -> _DdmCoordinate:
     """
     Convert a coordinate axis from decimal degrees (DD) to degrees decimal minutes (DDM).
 
@@ -13,7 +28,7 @@ def _convert_coordinate_dd_2_ddm(coordinate: float, positive_symbol: str, negati
     converter - https://github.com/PolarGeospatialCenter/pgc-coordinate-converter,
 
     For example, a coordinate value of '-69.91516669280827' with positive symbol 'N' and negative 'S', becomes:
-    `{'degree': 69.0, 'minutes': 54.9100015684962, 'sign': 'S'}`.
+    `_DdmCoordinate(degree=69, minutes=54.91000156849623, sign='S')`.
 
     :type coordinate: float
     :param coordinate: Coordinate axis value to convert
@@ -21,24 +36,12 @@ def _convert_coordinate_dd_2_ddm(coordinate: float, positive_symbol: str, negati
     :param positive_symbol: Symbol to use if converted value is positive
     :type negative_symbol; str
     :param negative_symbol: Symbol to use if converted value is negative
-    :rtype: dict
+    :rtype: _DdmCoordinate
     :return: Converted coordinate split into degrees, minutes and positive/negative symbol
     """
-    coordinate_elements: list[str] = str(coordinate).split(".")
-
-    ddm_coordinate: dict[str, Union[float, str]] = {
-        "degree": abs(float(coordinate_elements[0])),
-        "minutes": 0,
-        "sign": negative_symbol,
-    }
-
-    with suppress(IndexError):
-        ddm_coordinate["minutes"] = abs(float(f"0.{coordinate_elements[1]}") * 60.0)
+    fraction, degree = modf(abs(coordinate))
 
-    if coordinate >= 0:
-        ddm_coordinate["sign"] = positive_symbol
-
-    return ddm_coordinate
+    return _DdmCoordinate(int(degree), fraction * 60.0, positive_symbol if coordinate >= 0 else negative_symbol)
 
 
 def convert_coordinate_dd_2_ddm(lon: float, lat: float) -> dict[str, str]:
@@ -54,8 +57,8 @@ def convert_coordinate_dd_2_ddm(lon: float, lat: float) -> dict[str, str]:
     lat = _convert_coordinate_dd_2_ddm(lat, positive_symbol="N", negative_symbol="S")
 
     return {
-        "lon": f"{int(lon['degree'])}° {'{:.6f}'.format(lon['minutes'])}' {lon['sign']}",
-        "lat": f"{int(lat['degree'])}° {'{:.6f}'.format(lat['minutes'])}' {lat['sign']}",
+        "lon": f"{lon.degree}° {lon.minutes:.6f}' {lon.sign}",
+        "lat": f"{lat.degree}° {lat.minutes:.6f}' {lat.sign}",
     }
 
 
@@ -72,17 +75,46 @@ def convert_coordinate_dd_2_ddm_padded(lon: float, lat: float) -> dict[str, str]
     lat = _convert_coordinate_dd_2_ddm(lat, positive_symbol="N", negative_symbol="S")
 
     return {
-        "lon": f"{str(int(lon['degree'])).zfill(3)}° {'{:.6f}'.format(lon['minutes']).zfill(9)}' {lon['sign']}",
-        "lat": f"{str(int(lat['degree'])).zfill(2)}° {'{:.6f}'.format(lat['minutes']).zfill(9)}' {lat['sign']}",
+        "lon": f"{lon.degree:03d}° {lon.minutes:09.6f}' {lon.sign}",
+        "lat": f"{lat.degree:02d}° {lat.minutes:09.6f}' {lat.sign}",
     }
 
 
+@lru_cache(maxsize=1)
+def _date_string(day: int) -> str:
+    """
+    Format a day since the Unix epoch (UTC) as a file name date.
+
+    Cached so the date is only formatted once per day, regardless of how many file names are generated.
+
+    :type day: int
+    :param day: number of whole days since the Unix epoch
+    :rtype str
+    :return: formatted date
+    """
+    return strftime("%Y_%m_%d", gmtime(day * 86400))
+
+
+@lru_cache(maxsize=64)
+def _split_file_name_template(name: str) -> tuple[str, ...]:
+    """
+    Split file name template around each date placeholder.
+
+    :type name: str
+    :param name: file name possibly containing date placeholders
+    :rtype tuple
+    :return: text around placeholders, a single item if name does not contain a placeholder
+    """
+    return tuple(name.split("{{date}}"))
+
+
 def file_name_with_date(name: str) -> str:
     """
     Generate file name string with placeholder replaced by current date.
 
     This function is intended for use in generating date stamped file names. The date value is formatted as an ISO 8601
     date (i.e. 'YYYY-MM-DD'). The input file name must contain the placeholder '{{date}}' to be correctly substituted.
+    All occurrences of the placeholder are substituted.
 
     For example if today's date is May 24th 2014, an input of: 'foo-{{date}}' is returned as 'foo-2014-05-24'.
 
@@ -91,4 +123,27 @@ def file_name_with_date(name: str) -> str:
     :rtype str
     :return: file name containing current date
     """
-    return name.replace("{{date}}", f"{datetime.now(tz=timezone.utc).date().strftime('%Y_%m_%d')}")
+    parts = _split_file_name_template(name)
+    if len(parts) == 1:
+        return name
+
+    return _date_string(int(time() // 86400)).join(parts)
+
+
+def canonical_ulid(value: str) -> str:
+    """
+    Validate a ULID string and return it in its canonical form.
+
+    Values already in canonical form (e.g. IDs previously generated by this library) are returned as is, without being
+    parsed and re-encoded. Other values are parsed using `ulid.from_str()`, normalising (e.g. lower case) values.
+
+    :type value: str
+    :param value: ULID string
+    :rtype str
+    :return: canonical ULID string
+    :raises ValueError: if value is not a valid ULID
+    """
+    if isinstance(value, str) and _ulid_pattern.fullmatch(value):
+        return value
+
+    return str(ulid.from_str(value))
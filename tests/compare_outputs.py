@@ -1,21 +1,34 @@
 import argparse
+import os
+from collections.abc import Iterator
 from datetime import date, datetime, timezone
 from hashlib import sha256
 from pathlib import Path
 
+try:
+    from hashlib import file_digest
+except ImportError:  # Python < 3.11
+    file_digest = None
+
 reference_path = Path("./tests/resources/test-network/reference-outputs/")
 reference_date = date(2024, 11, 22)
 
+_chunk_size = 1 << 20
+
 
 def sha256sum(path: Path) -> str:
-    """Calculate checksum for file using SHA256."""
-    file_hash = sha256()
+    """
+    Calculate checksum for file using SHA256.
 
+    Where available (Python 3.11+), `hashlib.file_digest` is used to hash the file without a Python level loop.
+    Otherwise files are read in 1 MiB chunks, rather than the hash block size (64 bytes).
+    """
     with path.open("rb") as file:
-        while True:
-            chunk = file.read(file_hash.block_size)
-            if not chunk:
-                break
+        if file_digest is not None:
+            return file_digest(file, "sha256").hexdigest()
+
+        file_hash = sha256()
+        for chunk in iter(lambda: file.read(_chunk_size), b""):
             file_hash.update(chunk)
 
     return file_hash.hexdigest()
@@ -38,6 +51,10 @@ def make_paths(base_path: Path, date_: date) -> list[Path]:
     return [
         base_path.joinpath(f"./CSV/00_WAYPOINTS_DDM_{date_str}.csv"),
         base_path.joinpath(f"./CSV/00_WAYPOINTS_DD_{date_str}.csv"),
+        base_path.joinpath("./CSV/00_ROUTES.csv"),
+        base_path.joinpath("./CSV/ROUTES/01_BRAVO_TO_ALPHA.csv"),
+        base_path.joinpath("./CSV/ROUTES/02_BRAVO_TO_BRAVO.csv"),
+        base_path.joinpath("./CSV/ROUTES/03_BRAVO_TO_LIMA.csv"),
         base_path.joinpath(f"./FPL/00_WAYPOINTS_{date_str}.fpl"),
         base_path.joinpath("./FPL/01_BRAVO_TO_ALPHA.fpl"),
         base_path.joinpath("./FPL/02_BRAVO_TO_BRAVO.fpl"),
@@ -47,6 +64,23 @@ def make_paths(base_path: Path, date_: date) -> list[Path]:
     ]
 
 
+def _iter_files(path: Path) -> Iterator[Path]:
+    """
+    Recursively yield files with an extension within a directory.
+
+    Equivalent to `path.glob("**/*.*")` for files, using `os.scandir` to avoid a separate `stat()` call per path.
+
+    :param path: directory to search
+    :return: file paths
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                yield from _iter_files(Path(entry.path))
+            elif "." in entry.name:
+                yield Path(entry.path)
+
+
 def check_for_unexpected_paths(expected_paths: list[Path], search_path: Path) -> None:
     """
     Check whether a directory contains files other than a list of expected values.
@@ -59,9 +93,10 @@ def check_for_unexpected_paths(expected_paths: list[Path], search_path: Path) ->
     :raises RuntimeError: unexpected path found
     """
     ignored_files = [".DS_Store"]
+    expected = frozenset(expected_paths)
 
-    for path in search_path.glob("**/*.*"):
-        if path not in expected_paths and path.name not in ignored_files:
+    for path in _iter_files(search_path):
+        if path not in expected and path.name not in ignored_files:
             print(expected_paths)
             msg = f"Unexpected path {path.resolve()!r} found - aborting."
             raise RuntimeError(msg)
@@ -98,16 +133,17 @@ def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("outputs")
     args = parser.parse_args()
-    outputs_path = Path(args.outputs)
+    reference_dir = reference_path.resolve()
+    outputs_dir = Path(args.outputs).resolve()
 
-    print(f"{reference_path.resolve() =}")
-    print(f"{outputs_path.resolve() =}")
+    print(f"{reference_dir =}")
+    print(f"{outputs_dir =}")
 
-    reference_paths = make_paths(base_path=reference_path.resolve(), date_=reference_date)
-    outputs_paths = make_paths(base_path=outputs_path.resolve(), date_=datetime.now(tz=timezone.utc).date())
+    reference_paths = make_paths(base_path=reference_dir, date_=reference_date)
+    outputs_paths = make_paths(base_path=outputs_dir, date_=datetime.now(tz=timezone.utc).date())
 
-    check_for_unexpected_paths(expected_paths=reference_paths, search_path=reference_path.resolve())
-    check_for_unexpected_paths(expected_paths=outputs_paths, search_path=outputs_path.resolve())
+    check_for_unexpected_paths(expected_paths=reference_paths, search_path=reference_dir)
+    check_for_unexpected_paths(expected_paths=outputs_paths, search_path=outputs_dir)
 
     compare_outputs_with_reference(reference_paths=reference_paths, comparison_paths=outputs_paths)
 
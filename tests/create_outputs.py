@@ -17,13 +17,18 @@ def main() -> None:
     print(f"Input path: {input_path.resolve()}")
     print(f"Output path: {output_path.resolve()}")
 
-    input_gpx = Path("./tests/resources/test-network/test-network.gpx")
     network = MainAirUnitNetwork(output_path=output_path)
 
-    network.load_gpx(path=input_gpx)
+    network.load_gpx(path=input_path)
     network.display()
 
     network.dump_csv()
+
+    # route CSVs are not part of the network outputs, they are included to check lat/lon columns in each CSV mode
+    routes_path = output_path.joinpath("CSV/ROUTES")
+    routes_path.mkdir(parents=True, exist_ok=True)
+    network.routes.dump_csv(path=output_path.joinpath("CSV/00_ROUTES.csv"), inc_dd_lat_lon=True, inc_ddm_lat_lon=True)
+    network.routes.dump_csv(path=routes_path, separate_files=True, inc_ddm_lat_lon=True)
     network.dump_gpx()
     network.dump_fpl()
     network.dump_pdf()
@@ -3,6 +3,17 @@ from pathlib import Path
 
 from gpxpy.gpx import GPX, GPXRoute, GPXRoutePoint, GPXWaypoint
 
+_optional_waypoint_properties = (
+    "name",
+    "last_accessed_at",
+    "last_accessed_by",
+    "colocated_with",
+    "fuel",
+    "elevation_ft",
+    "comment",
+    "category",
+)
+
 
 def load_test_network(path: Path) -> dict:
     """Load network features from JSON file."""
@@ -10,6 +21,21 @@ def load_test_network(path: Path) -> dict:
         return json.load(network_file)
 
 
+def _index_waypoints(data: dict) -> dict:
+    """
+    Index network waypoints by identifier.
+
+    Where identifiers are duplicated, the first waypoint is indexed, consistent with searching the list of waypoints.
+
+    :param data: network features
+    :return: waypoints indexed by identifier
+    """
+    waypoints = {}
+    for waypoint in data["waypoints"]:
+        waypoints.setdefault(waypoint["identifier"], waypoint)
+    return waypoints
+
+
 def convert_to_geojson(network: str, data: dict, path: Path) -> None:
     """
     Convert network features to GeoJSON.
@@ -34,22 +60,17 @@ def convert_to_geojson(network: str, data: dict, path: Path) -> None:
             "properties": {
                 "feature_type": "waypoint",
                 "identifier": waypoint["identifier"],
+                **{
+                    property_: waypoint[property_]
+                    for property_ in _optional_waypoint_properties
+                    if waypoint.get(property_) is not None
+                },
             },
         }
-        for property_ in [
-            "name",
-            "last_accessed_at",
-            "last_accessed_by",
-            "colocated_with",
-            "fuel",
-            "elevation_ft",
-            "comment",
-            "category",
-        ]:
-            if property_ in waypoint and waypoint[property_] is not None:
-                feature["properties"][property_] = waypoint[property_]
         features["features"].append(feature)
 
+    waypoints = _index_waypoints(data)
+
     for route in data["routes"]:
         feature = {
             "type": "Feature",
@@ -57,15 +78,14 @@ def convert_to_geojson(network: str, data: dict, path: Path) -> None:
             "properties": {"feature_type": "route", "identifier": route["identifier"]},
         }
         for route_waypoint in route["waypoints"]:
-            for waypoint in data["waypoints"]:
-                if waypoint["identifier"] == route_waypoint["waypoint_designator"]:
-                    feature["geometry"]["coordinates"].append([waypoint["lon"], waypoint["lat"]])
-                    break
+            waypoint = waypoints.get(route_waypoint["waypoint_designator"])
+            if waypoint is not None:
+                feature["geometry"]["coordinates"].append([waypoint["lon"], waypoint["lat"]])
 
         features["features"].append(feature)
 
     with path.open(mode="w") as file:
-        json.dump(features, file, indent=True, sort_keys=True)
+        json.dump(features, file, indent=1, sort_keys=True)
 
 
 def convert_to_gpx(network: str, data: dict, path: Path) -> None:
@@ -111,19 +131,20 @@ def convert_to_gpx(network: str, data: dict, path: Path) -> None:
 
         gpx.waypoints.append(gpx_waypoint)
 
+    waypoints = _index_waypoints(data)
+
     for route in data["routes"]:
         gpx_route = GPXRoute()
         gpx_route.name = route["identifier"]
 
         for route_waypoint in route["waypoints"]:
-            for waypoint in data["waypoints"]:
-                if waypoint["identifier"] == route_waypoint["waypoint_designator"]:
-                    gpx_route_waypoint = GPXRoutePoint()
-                    gpx_route_waypoint.name = waypoint["identifier"]
-                    gpx_route_waypoint.longitude = waypoint["lon"]
-                    gpx_route_waypoint.latitude = waypoint["lat"]
-                    gpx_route.points.append(gpx_route_waypoint)
-                    break
+            waypoint = waypoints.get(route_waypoint["waypoint_designator"])
+            if waypoint is not None:
+                gpx_route_waypoint = GPXRoutePoint()
+                gpx_route_waypoint.name = waypoint["identifier"]
+                gpx_route_waypoint.longitude = waypoint["lon"]
+                gpx_route_waypoint.latitude = waypoint["lat"]
+                gpx_route.points.append(gpx_route_waypoint)
 
         gpx.routes.append(gpx_route)
 